@@ -0,0 +1,241 @@
+"""Numba-compiled CPU core for the register / memory / draw opcodes.
+
+Importing this module requires `numba`; `emulator.py` falls back to the
+regular Python dispatch loop when it is unavailable.
+
+`run_cycles` executes instructions directly on NumPy views of the emulator's
+memory / register / stack arrays. DXYN is drawn in-loop when the display keeps
+a NumPy `pixels` buffer (pygame backend); the touched box is reported back
+through `state` so the display can re-blit just that area. The loop returns
+early, *without* consuming the opcode, in front of anything else that needs
+Python-side services (clear, sound, RNG pool refill, blocking key wait,
+DXYN when the caller has no pixel buffer to hand over)
+or that would fault (bad PC, stack over/underflow, out-of-range memory or key
+index). The caller runs that single instruction through the normal handler
+table - which also raises the usual errors - and then resumes the compiled
+loop.
+"""
+import numba
+import numpy as np
+
+from .constants import MEMORY_SIZE, STACK_SIZE
+
+# Layout of the int64 `state` scratch array shared with Chip8
+PC, SP, I_REG, DT = 0, 1, 2, 3
+DREW = 4                                   # Non-zero if any DXYN ran
+DIRTY_X0, DIRTY_Y0, DIRTY_X1, DIRTY_Y1 = 5, 6, 7, 8  # Touched box, x0 == -1 if none
+RAND_IDX = 9                               # Next unread byte of the Cxnn random pool
+WRITE_LO, WRITE_HI = 10, 11                # Memory range written (Fx33 / Fx55), lo == -1 if none
+STATE_SIZE = 12
+
+
+@numba.njit(cache=True)
+def _mark(state, x0, y0, x1, y1):
+    if state[DIRTY_X0] < 0:
+        state[DIRTY_X0], state[DIRTY_Y0], state[DIRTY_X1], state[DIRTY_Y1] = x0, y0, x1, y1
+    else:
+        state[DIRTY_X0] = min(state[DIRTY_X0], x0)
+        state[DIRTY_Y0] = min(state[DIRTY_Y0], y0)
+        state[DIRTY_X1] = max(state[DIRTY_X1], x1)
+        state[DIRTY_Y1] = max(state[DIRTY_Y1], y1)
+
+
+@numba.njit(cache=True)
+def _mark_write(state, lo, hi):
+    if state[WRITE_LO] < 0:
+        state[WRITE_LO], state[WRITE_HI] = lo, hi
+    else:
+        state[WRITE_LO] = min(state[WRITE_LO], lo)
+        state[WRITE_HI] = max(state[WRITE_HI], hi)
+
+
+@numba.njit(cache=True)
+def _draw(pixels, memory, I, x, y, n, wrap, state):
+    """XOR an n-row sprite from memory[I:] into pixels; return 1 on collision.
+
+    Matches `PygameDisplay.draw_sprite`: clipped at the edges unless `wrap`,
+    in which case rows / columns wrap around.
+    """
+    height, width = pixels.shape
+    collision = 0
+    if wrap:
+        x0 = x % width
+        y0 = y % height
+        for row in range(n):
+            yy = (y0 + row) % height
+            byte = memory[I + row]
+            for col in range(8):
+                if byte & (0x80 >> col):
+                    xx = (x0 + col) % width
+                    if pixels[yy, xx]:
+                        collision = 1
+                    pixels[yy, xx] ^= 1
+        if n:
+            cols_wrap = x0 + 7 >= width
+            rows_wrap = y0 + n - 1 >= height
+            _mark(
+                state,
+                0 if cols_wrap else x0,
+                0 if rows_wrap else y0,
+                width if cols_wrap else x0 + 8,
+                height if rows_wrap else y0 + n,
+            )
+    else:
+        rows_avail = max(0, min(n, height - y))
+        cols_avail = max(0, min(8, width - x))
+        for row in range(rows_avail):
+            byte = memory[I + row]
+            for col in range(cols_avail):
+                if byte & (0x80 >> col):
+                    if pixels[y + row, x + col]:
+                        collision = 1
+                    pixels[y + row, x + col] ^= 1
+        if rows_avail and cols_avail:
+            _mark(state, x, y, x + cols_avail, y + rows_avail)
+    state[DREW] = 1
+    return collision
+
+
+@numba.njit(cache=True)
+def run_cycles(memory, V, stack, keys, pixels, rand_pool, state, cycles, can_draw, shift_legacy, load_store_increment_i, draw_wrap):
+    """Execute up to `cycles` instructions; return how many were executed."""
+    pc = state[PC]
+    sp = state[SP]
+    I = state[I_REG]
+    dt = state[DT]
+    rand_idx = state[RAND_IDX]
+    done = 0
+    while done < cycles:
+        if pc + 1 >= MEMORY_SIZE:
+            break
+        opcode = (np.int64(memory[pc]) << 8) | np.int64(memory[pc + 1])
+        op = opcode >> 12
+        x = (opcode >> 8) & 0xF
+        y = (opcode >> 4) & 0xF
+        n = opcode & 0xF
+        nn = opcode & 0xFF
+        nnn = opcode & 0x0FFF
+        vx = np.int64(V[x])
+        vy = np.int64(V[y])
+        next_pc = pc + 2
+
+        if op == 0x0:
+            if opcode == 0x00EE:
+                if sp == 0:
+                    break
+                sp -= 1
+                next_pc = np.int64(stack[sp])
+            elif opcode == 0x00E0:
+                break
+        elif op == 0x1:
+            next_pc = nnn
+        elif op == 0x2:
+            if sp >= STACK_SIZE:
+                break
+            stack[sp] = next_pc
+            sp += 1
+            next_pc = nnn
+        elif op == 0x3:
+            if vx == nn:
+                next_pc += 2
+        elif op == 0x4:
+            if vx != nn:
+                next_pc += 2
+        elif op == 0x5:
+            if n == 0 and vx == vy:
+                next_pc += 2
+        elif op == 0x6:
+            V[x] = nn
+        elif op == 0x7:
+            V[x] = (vx + nn) & 0xFF
+        elif op == 0x8:
+            # Register reads mirror the Python handlers exactly (VF may alias x / y)
+            if n == 0x0:
+                V[x] = vy
+            elif n == 0x1:
+                V[x] = vx | vy
+            elif n == 0x2:
+                V[x] = vx & vy
+            elif n == 0x3:
+                V[x] = vx ^ vy
+            elif n == 0x4:
+                sum_val = vx + vy
+                V[x] = sum_val & 0xFF
+                V[0xF] = 1 if sum_val > 0xFF else 0
+            elif n == 0x5:
+                V[0xF] = 1 if vx > vy else 0
+                V[x] = (np.int64(V[x]) - np.int64(V[y])) & 0xFF
+            elif n == 0x6:
+                source = vy if shift_legacy else vx
+                V[0xF] = source & 0x1
+                V[x] = (source >> 1) & 0xFF
+            elif n == 0x7:
+                V[0xF] = 1 if vy > vx else 0
+                V[x] = (np.int64(V[y]) - np.int64(V[x])) & 0xFF
+            elif n == 0xE:
+                source = vy if shift_legacy else vx
+                V[0xF] = (source & 0x80) >> 7
+                V[x] = (source << 1) & 0xFF
+        elif op == 0x9:
+            if n == 0 and vx != vy:
+                next_pc += 2
+        elif op == 0xA:
+            I = nnn
+        elif op == 0xB:
+            next_pc = nnn + np.int64(V[0])
+        elif op == 0xD:
+            if not can_draw or I + n > MEMORY_SIZE:
+                break
+            V[0xF] = _draw(pixels, memory, I, vx, vy, n, draw_wrap, state)
+        elif op == 0xC:
+            if rand_idx >= rand_pool.shape[0]:
+                break
+            V[x] = rand_pool[rand_idx] & nn
+            rand_idx += 1
+        elif op == 0xE:
+            if nn == 0x9E or nn == 0xA1:
+                if vx >= keys.shape[0]:
+                    break
+                if (keys[vx] != 0) == (nn == 0x9E):
+                    next_pc += 2
+        else:  # 0xF
+            if nn == 0x07:
+                V[x] = dt
+            elif nn == 0x0A or nn == 0x18:
+                break
+            elif nn == 0x15:
+                dt = vx
+            elif nn == 0x1E:
+                I += vx
+            elif nn == 0x29:
+                I = vx * 5
+            elif nn == 0x33:
+                if I + 2 >= MEMORY_SIZE:
+                    break
+                memory[I] = vx // 100
+                memory[I + 1] = (vx // 10) % 10
+                memory[I + 2] = vx % 10
+                _mark_write(state, I, I + 3)
+            elif nn == 0x55:
+                if I + x >= MEMORY_SIZE:
+                    break
+                for i in range(x + 1):
+                    memory[I + i] = V[i]
+                _mark_write(state, I, I + x + 1)
+                if load_store_increment_i:
+                    I += x + 1
+            elif nn == 0x65:
+                if I + x >= MEMORY_SIZE:
+                    break
+                for i in range(x + 1):
+                    V[i] = memory[I + i]
+                if load_store_increment_i:
+                    I += x + 1
+        pc = next_pc
+        done += 1
+    state[PC] = pc
+    state[SP] = sp
+    state[I_REG] = I
+    state[DT] = dt
+    state[RAND_IDX] = rand_idx
+    return done
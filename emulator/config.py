@@ -27,4 +27,5 @@ class EmulatorConfig:
     use_pygame: bool = True                # Attempt pygame window if available (ignored if use_tk True)
     use_tk: bool = False                   # Prefer Tkinter GUI (menus) when True
     sound_enabled: bool = True             # Enable/disable sound beeps
+    use_jit: bool = True                   # Use the numba-compiled CPU core if numba is installed
     quirks: QuirkConfig = field(default_factory=QuirkConfig)  # Avoid shared mutable default
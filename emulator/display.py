@@ -3,9 +3,19 @@
 Clearing now uses ANSI escape sequences instead of spawning a subshell.
 This avoids overhead and external dependencies; works on most modern
 terminals (including macOS default Terminal and iTerm). On the first
-render we issue a full clear (2J) then subsequent renders just move the
-cursor to home (H) before redrawing frame buffer.
+render we issue a full clear (2J) and draw the whole frame; subsequent
+renders diff against a shadow copy of what is on screen and only emit the
+changed span of each changed row, addressed with cursor positioning
+(\x1b[row;colH). Output is encoded to bytes once and handed to the binary
+stdout buffer in a single write.
+
+Each screen row is stored as one Python int (bit `width - 1 - col` is
+column `col`), so drawing a sprite row is a shift, an AND for collision and
+an XOR instead of a per-bit loop.
 """
+import sys
+from typing import Optional
+
 
 class Display:
     """Minimal ANSI terminal display backend.
@@ -18,49 +28,92 @@ class Display:
     def __init__(self, width: int, height: int):
         self.width = width
         self.height = height
-        self.pixels: list[list[int]] = [[0] * width for _ in range(height)]
+        self.rows: list[int] = [0] * height
+        self._blank: list[int] = [0] * height
         self.draw_flag: bool = False
         self._first_render = True
+        self._full_mask = (1 << width) - 1
+        # Pre-encoded cell glyphs; frames bypass print() and go straight to the byte stream
+        self._on = "█".encode("utf-8")
+        self._off = b" "
+        # None when stdout has no byte buffer (pythonw, IDLE, redirect_stdout)
+        self._stdout = getattr(sys.stdout, "buffer", None)
+        self._prev: list[int] = [0] * height  # What the terminal shows
 
     def clear(self) -> None:
-        self.pixels = [[0 for _ in range(self.width)] for _ in range(self.height)]
+        self.rows[:] = self._blank  # In place: C-level copy, no new list per CLS
         self.draw_flag = True
 
-    def draw_sprite(self, x: int, y: int, sprite, height: int, wrap: bool = False):
+    def draw_sprite(self, x: int, y: int, sprite, height: int, wrap: bool = False) -> bool:
         """Draw a sprite at (x, y).
 
         If wrap is True, pixels wrap around screen edges (Super-CHIP style quirk);
-        otherwise they are clipped when exceeding bounds.
+        otherwise they are clipped when exceeding bounds. `sprite` is any
+        indexable of byte values (memoryview, bytes, array, list).
         Returns True if any pixel unset due to XOR collision.
         """
+        rows = self.rows
+        width = self.width
         collision = False
-        for row in range(height):
-            yy = (y + row) % self.height if wrap else (y + row)
-            if yy >= self.height:
-                break
-            sprite_byte = sprite[row]
-            for col in range(8):
-                if (sprite_byte & (0x80 >> col)) == 0:
-                    continue
-                xx = (x + col) % self.width if wrap else (x + col)
-                if xx >= self.width:
-                    break
-                if self.pixels[yy][xx] == 1:
+        if wrap:
+            x %= width
+            for i in range(height):
+                # Place the byte at the left edge, then rotate right by x
+                v = sprite[i] << (width - 8)
+                mask = ((v >> x) | (v << (width - x))) & self._full_mask
+                yy = (y + i) % self.height
+                if rows[yy] & mask:
                     collision = True
-                self.pixels[yy][xx] ^= 1
+                rows[yy] ^= mask
+        elif x < width:
+            shift = width - 8 - x
+            for i in range(min(height, self.height - y)):
+                # Negative shift means the sprite hangs off the right edge: drop those bits
+                mask = sprite[i] << shift if shift >= 0 else sprite[i] >> -shift
+                yy = y + i
+                if rows[yy] & mask:
+                    collision = True
+                rows[yy] ^= mask
         self.draw_flag = True
         return collision
 
+    def _encode(self, row: int, c0: int = 0, c1: Optional[int] = None) -> bytes:
+        # Columns [c0, c1) of a row as glyph bytes
+        bits = format(row, f"0{self.width}b")[c0:c1].encode("ascii")
+        return bits.replace(b"1", self._on).replace(b"0", self._off)
+
     def render(self) -> None:
         if not self.draw_flag:
             return
-        # ANSI clear strategy: full clear once, then home cursor only.
+        rows, prev = self.rows, self._prev
         if self._first_render:
-            print("\x1b[2J\x1b[H", end="")  # Clear entire screen & home
+            # Full clear & home once, then the whole frame
+            frame = b"\n".join([self._encode(row) for row in rows])
+            payload = b"\x1b[2J\x1b[H" + frame + b"\n"
             self._first_render = False
         else:
-            print("\x1b[H", end="")  # Home cursor only
-        # Build lines then join for fewer print calls
-        out_lines = [''.join('█' if px else ' ' for px in row) for row in self.pixels]
-        print("\n".join(out_lines))
+            width = self.width
+            parts = []
+            for r in range(self.height):
+                diff = rows[r] ^ prev[r]
+                if not diff:
+                    continue
+                # Leftmost / rightmost changed columns from the highest / lowest set bits
+                c0 = width - diff.bit_length()
+                c1 = width - ((diff & -diff).bit_length() - 1)
+                parts.append(b"\x1b[%d;%dH" % (r + 1, c0 + 1))
+                parts.append(self._encode(rows[r], c0, c1))
+            if not parts:
+                self.draw_flag = False
+                return
+            # Park the cursor below the frame so other output doesn't land inside it
+            parts.append(b"\x1b[%d;1H" % (self.height + 1))
+            payload = b"".join(parts)
+        self._prev = list(rows)
+        if self._stdout is not None:
+            self._stdout.write(payload)
+            self._stdout.flush()
+        elif sys.stdout is not None:  # Text-only stream
+            sys.stdout.write(payload.decode("utf-8"))
+            sys.stdout.flush()
         self.draw_flag = False
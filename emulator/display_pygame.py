@@ -1,8 +1,15 @@
 """Pygame-based display for CHIP-8 with simple scaling and optional color customization."""
 from __future__ import annotations
+import numpy as np
 import pygame
 
+# Byte value -> its 8 pixels as 0/1 bytes, MSB first: a packed row expands to
+# a `pixels` row with one lookup per 8 columns
+_SPREAD = [bytes((b >> (7 - i)) & 1 for i in range(8)) for b in range(256)]
+
 class PygameDisplay:
+    _EVENT_TYPES = (pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP)
+
     def __init__(self, width: int, height: int, scale: int = 10):
         self.width = width
         self.height = height
@@ -10,57 +17,154 @@ class PygameDisplay:
         self.surface = None
         self.window = None
         self.draw_flag = False
-        self.pixels = [[0 for _ in range(width)] for _ in range(height)]
+        self._pixels = np.zeros((height, width), dtype=np.uint8)
+        self._mv = memoryview(self._pixels.reshape(-1))
+        # Python-side draws work on one int per row (bit `width - 1 - col` is
+        # column `col`, as in the console Display) and copy just the rows they
+        # touched into `_pixels` when it is next read. None means `_pixels` was
+        # handed out and may have changed, so the ints are rebuilt from it.
+        self._rows: list[int] | None = [0] * height
+        self._stale: set[int] = set()  # Rows whose int is ahead of `_pixels`
+        self._full_mask = (1 << width) - 1
+        self._pad = -width % 8  # Low bits to drop when a row has fewer than 8*k columns
+        self._dirty = None  # (x0, y0, x1, y1) of pixels changed since last render, or None
         self._init_window()
 
     def _init_window(self):
         pygame.init()
         self.window = pygame.display.set_mode((self.width * self.scale, self.height * self.scale))
         pygame.display.set_caption("CHIP-8 Emulator")
+        # Only these ever reach Python; mouse motion etc. is dropped at the SDL layer
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(self._EVENT_TYPES)
         self.surface = pygame.display.get_surface()
+        # Native-resolution frame; render() blits pixels here and scales up in one call
+        self._small = pygame.Surface((self.width, self.height))
+        self._palette = np.array([[0, 0, 0], [0, 255, 120]], dtype=np.uint8)  # off / on colors
+
+    @property
+    def pixels(self) -> np.ndarray:
+        """The (height, width) uint8 frame, up to date; callers may write to it.
+
+        The numba core draws into it directly (then reports the box through
+        `mark_dirty`), so handing it out drops the packed rows.
+        """
+        if self._stale:
+            self._flush()
+        self._rows = None
+        return self._pixels
+
+    def _flush(self):
+        """Copy the packed rows drawn since the last flush into `_pixels`."""
+        mv, rows, width, pad = self._mv, self._rows, self.width, self._pad
+        nbytes = (width + 7) // 8
+        spread = _SPREAD
+        for r in self._stale:
+            packed = (rows[r] << pad).to_bytes(nbytes, 'big')
+            mv[r * width:(r + 1) * width] = b''.join([spread[b] for b in packed])[:width]
+        self._stale.clear()
+
+    def _load_rows(self) -> list[int]:
+        """Rebuild the packed rows from `_pixels` (after the core drew into it)."""
+        pad = self._pad
+        self._rows = [int.from_bytes(row.tobytes(), 'big') >> pad for row in np.packbits(self._pixels, axis=1)]
+        return self._rows
 
     def clear(self):
-        self.pixels = [[0 for _ in range(self.width)] for _ in range(self.height)]
+        self._pixels.fill(0)  # In place: no reallocation per CLS
+        self._rows = [0] * self.height
+        self._stale.clear()
+        self._dirty = (0, 0, self.width, self.height)
         self.draw_flag = True
 
+    def mark_dirty(self, x0, y0, x1, y1):
+        """Report pixels drawn straight into `pixels` inside [x0, x1) x [y0, y1)."""
+        if self._stale:
+            self._flush()
+        self._rows = None
+        self._grow_dirty(x0, y0, x1, y1)
+
+    def _grow_dirty(self, x0, y0, x1, y1):
+        """Grow the pending dirty box to cover [x0, x1) x [y0, y1)."""
+        if self._dirty is None:
+            self._dirty = (x0, y0, x1, y1)
+        else:
+            dx0, dy0, dx1, dy1 = self._dirty
+            self._dirty = (min(dx0, x0), min(dy0, y0), max(dx1, x1), max(dy1, y1))
+
     def draw_sprite(self, x, y, sprite, height, wrap=False):
-        """Draw sprite with optional wrapping (default False to match base display)."""
+        """Draw sprite with optional wrapping (default False to match base display).
+
+        `sprite` is any indexable of byte values (memoryview / bytes / array('B')).
+        Each sprite row is a shift, an AND for collision and an XOR on the
+        packed row; only the rows touched are copied out to `pixels` later.
+        """
+        rows = self._rows
+        if rows is None:
+            rows = self._load_rows()
+        stale = self._stale
+        width = self.width
         collision = False
-        for row in range(height):
-            yy = (y + row) % self.height if wrap else (y + row)
-            if yy >= self.height:
-                break
-            sprite_byte = sprite[row]
-            for col in range(8):
-                if (sprite_byte & (0x80 >> col)) == 0:
-                    continue
-                xx = (x + col) % self.width if wrap else (x + col)
-                if xx >= self.width:
-                    break
-                if self.pixels[yy][xx] == 1:
+        if wrap:
+            x %= width
+            y %= self.height
+            full = self._full_mask
+            for i in range(height):
+                # Place the byte at the left edge, then rotate right by x
+                v = sprite[i] << (width - 8)
+                mask = ((v >> x) | (v << (width - x))) & full
+                yy = (y + i) % self.height
+                if rows[yy] & mask:
+                    collision = True
+                rows[yy] ^= mask
+                stale.add(yy)
+            if height:
+                # Box is the whole axis on any axis the sprite wraps around
+                cols_wrap = x + 8 > width
+                rows_wrap = y + height > self.height
+                self._grow_dirty(
+                    0 if cols_wrap else x,
+                    0 if rows_wrap else y,
+                    width if cols_wrap else x + 8,
+                    self.height if rows_wrap else y + height,
+                )
+        elif x < width:
+            shift = width - 8 - x
+            rows_avail = min(height, self.height - y)
+            for yy in range(y, y + rows_avail):
+                # Negative shift means the sprite hangs off the right edge: drop those bits
+                b = sprite[yy - y]
+                mask = b << shift if shift >= 0 else b >> -shift
+                if rows[yy] & mask:
                     collision = True
-                self.pixels[yy][xx] ^= 1
+                rows[yy] ^= mask
+                stale.add(yy)
+            if rows_avail > 0:
+                self._grow_dirty(x, y, min(x + 8, width), y + rows_avail)
         self.draw_flag = True
         return collision
 
     def render(self):
         if not self.draw_flag:
             return
-        self.surface.fill((0, 0, 0))
-        on_color = (0, 255, 120)
-        for y in range(self.height):
-            for x in range(self.width):
-                if self.pixels[y][x]:
-                    pygame.draw.rect(
-                        self.surface,
-                        on_color,
-                        (x * self.scale, y * self.scale, self.scale, self.scale),
-                    )
-        pygame.display.flip()
+        if self._dirty is not None:
+            # Only push the changed box: blit it at native size, scale it into
+            # the matching window rect and update just that rect.
+            x0, y0, x1, y1 = self._dirty
+            small = self._small.subsurface((x0, y0, x1 - x0, y1 - y0))
+            if self._stale:
+                self._flush()
+            rgb = self._palette[self._pixels[y0:y1, x0:x1]]  # (h, w, 3)
+            pygame.surfarray.blit_array(small, rgb.swapaxes(0, 1))
+            scale = self.scale
+            rect = pygame.Rect(x0 * scale, y0 * scale, (x1 - x0) * scale, (y1 - y0) * scale)
+            pygame.transform.scale(small, rect.size, self.surface.subsurface(rect))
+            pygame.display.update(rect)
+            self._dirty = None
         self.draw_flag = False
 
     def poll_events(self):
-        events = pygame.event.get()
+        events = pygame.event.get(self._EVENT_TYPES)
         for event in events:
             if event.type == pygame.QUIT:
                 raise KeyboardInterrupt
@@ -5,11 +5,15 @@ Quick-fix refactor highlights:
 * Add bounds / safety checks (stack overflow/underflow, PC fetch guard, ROM size check).
 * Increase instruction throughput (hundreds of instructions per 60Hz frame) while keeping timer frequency at 60Hz.
 * Explicitly coerce VF to 0/1 and clarify collision semantics.
+* Table-driven opcode dispatch: one tuple index on the top nibble plus small
+  per-family dicts (0x0 / 0x8 / 0xE / 0xF) instead of a long if/elif chain.
+* Optional numba-compiled core (`_core.py`) for register / memory opcodes,
+  handing I/O opcodes back to the Python handlers.
 """
 
 import random
 import array
-from typing import List, Optional
+from typing import Optional
 
 from .constants import (
     FONTSET,
@@ -34,10 +38,23 @@ except Exception:  # pragma: no cover - fallback if pygame not available
     PygameInputHandler = None  # type: ignore
 from .sound import Sound
 from .config import EmulatorConfig
+try:
+    import numpy as np
+    from ._core import run_cycles as _jit_run_cycles, STATE_SIZE as _jit_state_size
+except Exception:  # pragma: no cover - fallback if numba not available
+    np = None  # type: ignore
+    _jit_run_cycles = None
 
 
 DEFAULT_CYCLES_PER_FRAME = 700  # Reasonable starting point for smooth gameplay
 
+_FONT = array.array('B', FONTSET)  # Copied into memory with one slice assignment
+
+RAND_POOL_SIZE = 4096  # Random bytes generated per refill for Cxnn
+
+# Fx33 lookup: register value -> (hundreds, tens, ones) digits
+_BCD = tuple((v // 100, (v // 10) % 10, v % 10) for v in range(256))
+
 
 class Chip8:
     """CHIP-8 virtual machine.
@@ -88,16 +105,29 @@ class Chip8:
         self.cycles_per_frame = self.config.cycles_per_frame
         self.halted = False
 
+        # Opcode dispatch tables (bound once) and per-address pre-decode cache
+        self._build_dispatch()
+        self._decoded: list = [None] * MEMORY_SIZE
+
+        # Numba core scratch buffers (used only when the JIT path is selected)
+        if _jit_run_cycles is not None:
+            self._jit_state = np.zeros(_jit_state_size, dtype=np.int64)
+
+        # Bind decode / instruction-loop variants for the current debug setting
+        self.set_debug(self.debug)
+
         # Load fontset
         self.load_fontset()
 
         # RNG and ROM state
         self._rand = random.Random()
+        self._rand_pool = array.array('B')  # Pre-generated Cxnn bytes, consumed via _rand_idx
+        self._rand_idx = 0
         self.rom_loaded = False
 
     def load_fontset(self) -> None:
-        for i, byte in enumerate(FONTSET):
-            self.memory[i] = byte
+        self.memory[0:len(_FONT)] = _FONT
+        self._invalidate(0, len(_FONT))
 
     def load_rom(self, rom_path: str) -> None:
         with open(rom_path, 'rb') as f:
@@ -105,161 +135,349 @@ class Chip8:
         max_len = MEMORY_SIZE - 0x200
         if len(rom) > max_len:
             raise ValueError(f"ROM too large ({len(rom)} bytes > {max_len})")
-        for i, byte in enumerate(rom):
-            self.memory[0x200 + i] = byte
+        self.memory[0x200:0x200 + len(rom)] = array.array('B', rom)
+        # Decode the ROM's aligned words up front; odd / later targets fill in lazily
+        self._decoded[:] = [None] * MEMORY_SIZE
+        for pc in range(0x200, min(0x200 + len(rom), MEMORY_SIZE - 1), 2):
+            self._predecode(pc)
         self.pc = 0x200
         self.halted = False
         self.rom_loaded = True
 
-    def fetch_opcode(self) -> int:
-        if self.pc >= MEMORY_SIZE or self.pc + 1 >= MEMORY_SIZE:
+    # Hot methods bind module constants as default args (_MEM / _STK) so lookups are LOAD_FAST
+    def fetch_opcode(self, _MEM: int = MEMORY_SIZE) -> int:
+        if self.pc + 1 >= _MEM:  # pc + 1 in range implies pc is too
             self.halted = True
             raise RuntimeError(f"PC out of bounds: {self.pc:04X}")
         opcode = (self.memory[self.pc] << 8) | self.memory[self.pc + 1]
         self.pc += 2
         return opcode
 
-    def decode_and_execute(self, opcode: int) -> None:
-        nnn = opcode & 0x0FFF
-        nn = opcode & 0x00FF
-        n = opcode & 0x000F
-        x = (opcode & 0x0F00) >> 8
-        y = (opcode & 0x00F0) >> 4
-        op = (opcode & 0xF000) >> 12
+    def _build_dispatch(self) -> None:
+        """Bind opcode handler tables once (top nibble + per-family sub-tables)."""
+        self._dispatch = (
+            self._op_sys,       # 0nnn / 00E0 / 00EE
+            self._op_jp,        # 1nnn
+            self._op_call,      # 2nnn
+            self._op_se_byte,   # 3xnn
+            self._op_sne_byte,  # 4xnn
+            self._op_se_reg,    # 5xy0
+            self._op_ld_byte,   # 6xnn
+            self._op_add_byte,  # 7xnn
+            self._op_alu,       # 8xy?
+            self._op_sne_reg,   # 9xy0
+            self._op_ld_i,      # Annn
+            self._op_jp_v0,     # Bnnn
+            self._op_rnd,       # Cxnn
+            self._op_drw,       # Dxyn
+            self._op_skp,       # Ex9E / ExA1
+            self._op_misc,      # Fx??
+        )
+        self._dispatch_0 = {
+            0x00E0: self._op_cls,
+            0x00EE: self._op_ret,
+        }
+        self._dispatch_8 = {
+            0x0: self._op_8_ld,
+            0x1: self._op_8_or,
+            0x2: self._op_8_and,
+            0x3: self._op_8_xor,
+            0x4: self._op_8_add,
+            0x5: self._op_8_sub,
+            0x6: self._op_8_shr,
+            0x7: self._op_8_subn,
+            0xE: self._op_8_shl,
+        }
+        self._dispatch_E = {
+            0x9E: self._op_skp_pressed,
+            0xA1: self._op_skp_not_pressed,
+        }
+        self._dispatch_F = {
+            0x07: self._op_f_ld_dt,
+            0x0A: self._op_f_wait_key,
+            0x15: self._op_f_set_dt,
+            0x18: self._op_f_set_st,
+            0x1E: self._op_f_add_i,
+            0x29: self._op_f_font,
+            0x33: self._op_f_bcd,
+            0x55: self._op_f_store,
+            0x65: self._op_f_load,
+        }
 
-        if self.debug:
-            print(f"PC: {self.pc-2:04X}, Opcode: {opcode:04X}")
+    def set_debug(self, enabled: bool) -> None:
+        """Toggle instruction tracing and re-bind the specialized hot paths.
 
-        # Dispatch based on first nibble
-        if op == 0x0:
-            if opcode == 0x00E0:
-                self.display.clear()
-            elif opcode == 0x00EE:
-                if self.sp == 0:
-                    self.halted = True
-                    raise RuntimeError("Stack underflow on RET")
-                self.sp -= 1
-                self.pc = self.stack[self.sp]
+        `decode_and_execute` and the per-frame instruction loop are chosen here
+        once, so the non-debug path carries no per-instruction debug test.
+        The numba core is only used with tracing off, and only for displays it
+        can draw into (a NumPy `pixels` buffer plus `mark_dirty`): for any other
+        backend every DXYN would bounce back to Python, which ends up slower
+        than the plain loop.
+        """
+        self.debug = enabled
+        if enabled:
+            self.decode_and_execute = self._decode_debug
+            self._run_cycles_impl = self._run_cycles_debug
+        else:
+            self.decode_and_execute = self._decode_fast
+            if self.config.use_jit and _jit_run_cycles is not None and self._jit_can_draw():
+                self._run_cycles_impl = self._run_cycles_jit
             else:
-                # Unimplemented 0x0??? instructions (scroll / extended) placeholder
-                if self.debug:
-                    print(f"Unknown 0x0 opcode: {opcode:04X}")
-        elif op == 0x1:
-            self.pc = nnn
-        elif op == 0x2:
-            if self.sp >= STACK_SIZE:
-                self.halted = True
-                raise RuntimeError("Stack overflow on CALL")
-            self.stack[self.sp] = self.pc
-            self.sp += 1
-            self.pc = nnn
-        elif op == 0x3:
-            if self.V[x] == nn:
-                self.pc += 2
-        elif op == 0x4:
-            if self.V[x] != nn:
-                self.pc += 2
-        elif op == 0x5:
-            if n == 0 and self.V[x] == self.V[y]:
-                self.pc += 2
-        elif op == 0x6:
-            self.V[x] = nn
-        elif op == 0x7:
-            self.V[x] = (self.V[x] + nn) & 0xFF
+                self._run_cycles_impl = self._run_cycles
+
+    def _predecode(self, pc: int) -> tuple:
+        """Decode the word at `pc` to a cached (leaf handler, opcode) pair.
+
+        Family handlers with sub-tables are resolved to the final handler here,
+        so cached instructions skip both dispatch levels. Anything writing
+        memory must call `_invalidate` for the bytes it touched.
+        """
+        opcode = (self.memory[pc] << 8) | self.memory[pc + 1]
+        op = opcode >> 12
+        if op == 0x0:
+            handler = self._dispatch_0.get(opcode, self._op_sys)
         elif op == 0x8:
-            if n == 0x0:
-                self.V[x] = self.V[y]
-            elif n == 0x1:
-                self.V[x] |= self.V[y]
-            elif n == 0x2:
-                self.V[x] &= self.V[y]
-            elif n == 0x3:
-                self.V[x] ^= self.V[y]
-            elif n == 0x4:
-                sum_val = self.V[x] + self.V[y]
-                self.V[x] = sum_val & 0xFF
-                self.V[0xF] = 1 if sum_val > 0xFF else 0
-            elif n == 0x5:
-                self.V[0xF] = 1 if self.V[x] > self.V[y] else 0
-                self.V[x] = (self.V[x] - self.V[y]) & 0xFF
-            elif n == 0x6:
-                source = self.V[y] if self.config.quirks.shift_legacy else self.V[x]
-                self.V[0xF] = source & 0x1
-                self.V[x] = (source >> 1) & 0xFF
-            elif n == 0x7:
-                self.V[0xF] = 1 if self.V[y] > self.V[x] else 0
-                self.V[x] = (self.V[y] - self.V[x]) & 0xFF
-            elif n == 0xE:
-                source = self.V[y] if self.config.quirks.shift_legacy else self.V[x]
-                self.V[0xF] = (source & 0x80) >> 7
-                self.V[x] = (source << 1) & 0xFF
-            else:
-                if self.debug:
-                    print(f"Unknown 8xy? opcode: {opcode:04X}")
-        elif op == 0x9:
-            if n == 0 and self.V[x] != self.V[y]:
-                self.pc += 2
-        elif op == 0xA:
-            self.I = nnn
-        elif op == 0xB:
-            self.pc = nnn + self.V[0]
-        elif op == 0xC:
-            # Random byte AND nn
-            self.V[x] = (self._rand.getrandbits(8)) & nn
-        elif op == 0xD:
-            x_pos = self.V[x]
-            y_pos = self.V[y]
-            # Bounds / safety: ensure sprite bytes readable
-            if self.I + n > MEMORY_SIZE:
-                self.halted = True
-                raise RuntimeError("Sprite fetch out of memory bounds")
-            sprite: List[int] = [self.memory[self.I + i] for i in range(n)]
-            collision = self.display.draw_sprite(x_pos, y_pos, sprite, n, wrap=self.config.quirks.draw_wrap)
-            self.V[0xF] = 1 if collision else 0
+            handler = self._dispatch_8.get(opcode & 0xF, self._op_alu)
         elif op == 0xE:
-            if nn == 0x9E:
-                if self.input_handler.is_key_pressed(self.V[x]):
-                    self.pc += 2
-            elif nn == 0xA1:
-                if not self.input_handler.is_key_pressed(self.V[x]):
-                    self.pc += 2
-            else:
-                if self.debug:
-                    print(f"Unknown Ex?? opcode: {opcode:04X}")
+            handler = self._dispatch_E.get(opcode & 0xFF, self._op_skp)
         elif op == 0xF:
-            if nn == 0x07:
-                self.V[x] = self.delay_timer
-            elif nn == 0x0A:
-                self.V[x] = self.input_handler.wait_for_key()
-            elif nn == 0x15:
-                self.delay_timer = self.V[x]
-            elif nn == 0x18:
-                self.sound.set_timer(self.V[x])
-            elif nn == 0x1E:
-                self.I += self.V[x]
-            elif nn == 0x29:
-                self.I = self.V[x] * 5
-            elif nn == 0x33:
-                val = self.V[x]
-                self.memory[self.I] = val // 100
-                self.memory[self.I + 1] = (val // 10) % 10
-                self.memory[self.I + 2] = val % 10
-            elif nn == 0x55:
-                for i in range(x + 1):
-                    self.memory[self.I + i] = self.V[i]
-                if self.config.quirks.load_store_increment_i:
-                    self.I += x + 1
-            elif nn == 0x65:
-                for i in range(x + 1):
-                    self.V[i] = self.memory[self.I + i]
-                if self.config.quirks.load_store_increment_i:
-                    self.I += x + 1
-            else:
-                if self.debug:
-                    print(f"Unknown Fx?? opcode: {opcode:04X}")
+            handler = self._dispatch_F.get(opcode & 0xFF, self._op_misc)
         else:
-            if self.debug:
-                print(f"Unknown opcode: {opcode:04X}")
+            handler = self._dispatch[op]
+        entry = self._decoded[pc] = (handler, opcode)
+        return entry
+
+    def _invalidate(self, start: int, end: int) -> None:
+        """Drop cached decodes overlapping memory[start:end] (an opcode spans pc, pc+1)."""
+        decoded = self._decoded
+        for pc in range(max(start - 1, 0), min(end, MEMORY_SIZE)):
+            decoded[pc] = None
+
+    def _decode_fast(self, opcode: int) -> None:
+        # Dispatch based on first nibble; families with sub-opcodes consult their own table
+        self._dispatch[opcode >> 12](opcode)
+
+    def _decode_debug(self, opcode: int) -> None:
+        print(f"PC: {self.pc-2:04X}, Opcode: {opcode:04X}")
+        self._dispatch[opcode >> 12](opcode)
+
+    # --- Opcode handlers (each receives the raw opcode and decodes what it needs) ---
+    def _op_sys(self, opcode: int) -> None:
+        handler = self._dispatch_0.get(opcode)
+        if handler is not None:
+            handler(opcode)
+        elif self.debug:
+            # Unimplemented 0x0??? instructions (scroll / extended) placeholder
+            print(f"Unknown 0x0 opcode: {opcode:04X}")
+
+    def _op_cls(self, opcode: int) -> None:
+        self.display.clear()
+
+    def _op_ret(self, opcode: int) -> None:
+        if self.sp == 0:
+            self.halted = True
+            raise RuntimeError("Stack underflow on RET")
+        self.sp -= 1
+        self.pc = self.stack[self.sp]
+
+    def _op_jp(self, opcode: int) -> None:
+        self.pc = opcode & 0x0FFF
+
+    def _op_call(self, opcode: int, _STK: int = STACK_SIZE) -> None:
+        if self.sp >= _STK:
+            self.halted = True
+            raise RuntimeError("Stack overflow on CALL")
+        self.stack[self.sp] = self.pc
+        self.sp += 1
+        self.pc = opcode & 0x0FFF
+
+    def _op_se_byte(self, opcode: int) -> None:
+        if self.V[(opcode >> 8) & 0xF] == opcode & 0xFF:
+            self.pc += 2
+
+    def _op_sne_byte(self, opcode: int) -> None:
+        if self.V[(opcode >> 8) & 0xF] != opcode & 0xFF:
+            self.pc += 2
+
+    def _op_se_reg(self, opcode: int) -> None:
+        V = self.V
+        if opcode & 0xF == 0 and V[(opcode >> 8) & 0xF] == V[(opcode >> 4) & 0xF]:
+            self.pc += 2
+
+    def _op_ld_byte(self, opcode: int) -> None:
+        self.V[(opcode >> 8) & 0xF] = opcode & 0xFF
+
+    def _op_add_byte(self, opcode: int) -> None:
+        V = self.V
+        x = (opcode >> 8) & 0xF
+        V[x] = (V[x] + opcode) & 0xFF
+
+    def _op_alu(self, opcode: int) -> None:
+        handler = self._dispatch_8.get(opcode & 0xF)
+        if handler is not None:
+            handler(opcode)
+        elif self.debug:
+            print(f"Unknown 8xy? opcode: {opcode:04X}")
+
+    def _op_8_ld(self, opcode: int) -> None:
+        V = self.V
+        V[(opcode >> 8) & 0xF] = V[(opcode >> 4) & 0xF]
+
+    def _op_8_or(self, opcode: int) -> None:
+        V = self.V
+        V[(opcode >> 8) & 0xF] |= V[(opcode >> 4) & 0xF]
+
+    def _op_8_and(self, opcode: int) -> None:
+        V = self.V
+        V[(opcode >> 8) & 0xF] &= V[(opcode >> 4) & 0xF]
+
+    def _op_8_xor(self, opcode: int) -> None:
+        V = self.V
+        V[(opcode >> 8) & 0xF] ^= V[(opcode >> 4) & 0xF]
+
+    def _op_8_add(self, opcode: int) -> None:
+        V = self.V
+        x = (opcode >> 8) & 0xF
+        sum_val = V[x] + V[(opcode >> 4) & 0xF]
+        V[x] = sum_val & 0xFF
+        V[0xF] = 1 if sum_val > 0xFF else 0
+
+    def _op_8_sub(self, opcode: int) -> None:
+        V = self.V
+        x = (opcode >> 8) & 0xF
+        y = (opcode >> 4) & 0xF
+        V[0xF] = 1 if V[x] > V[y] else 0
+        V[x] = (V[x] - V[y]) & 0xFF
+
+    def _op_8_shr(self, opcode: int) -> None:
+        V = self.V
+        x = (opcode >> 8) & 0xF
+        source = V[(opcode >> 4) & 0xF] if self.config.quirks.shift_legacy else V[x]
+        V[0xF] = source & 0x1
+        V[x] = (source >> 1) & 0xFF
+
+    def _op_8_subn(self, opcode: int) -> None:
+        V = self.V
+        x = (opcode >> 8) & 0xF
+        y = (opcode >> 4) & 0xF
+        V[0xF] = 1 if V[y] > V[x] else 0
+        V[x] = (V[y] - V[x]) & 0xFF
+
+    def _op_8_shl(self, opcode: int) -> None:
+        V = self.V
+        x = (opcode >> 8) & 0xF
+        source = V[(opcode >> 4) & 0xF] if self.config.quirks.shift_legacy else V[x]
+        V[0xF] = (source & 0x80) >> 7
+        V[x] = (source << 1) & 0xFF
+
+    def _op_sne_reg(self, opcode: int) -> None:
+        V = self.V
+        if opcode & 0xF == 0 and V[(opcode >> 8) & 0xF] != V[(opcode >> 4) & 0xF]:
+            self.pc += 2
+
+    def _op_ld_i(self, opcode: int) -> None:
+        self.I = opcode & 0x0FFF
+
+    def _op_jp_v0(self, opcode: int) -> None:
+        self.pc = (opcode & 0x0FFF) + self.V[0]
+
+    def _op_rnd(self, opcode: int) -> None:
+        # Random byte AND nn
+        self.V[(opcode >> 8) & 0xF] = self._rand8() & opcode & 0xFF
+
+    def _rand8(self) -> int:
+        """Next byte from the random pool, refilling it when exhausted."""
+        idx = self._rand_idx
+        if idx >= len(self._rand_pool):
+            self._rand_pool = array.array('B', self._rand.randbytes(RAND_POOL_SIZE))
+            idx = 0
+        self._rand_idx = idx + 1
+        return self._rand_pool[idx]
+
+    def _op_drw(self, opcode: int, _MEM: int = MEMORY_SIZE) -> None:
+        V = self.V
+        n = opcode & 0xF
+        # Bounds / safety: ensure sprite bytes readable
+        if self.I + n > _MEM:
+            self.halted = True
+            raise RuntimeError("Sprite fetch out of memory bounds")
+        # Zero-copy view; displays only index / buffer-read the sprite bytes
+        sprite = memoryview(self.memory)[self.I:self.I + n]
+        collision = self.display.draw_sprite(
+            V[(opcode >> 8) & 0xF], V[(opcode >> 4) & 0xF], sprite, n, wrap=self.config.quirks.draw_wrap
+        )
+        V[0xF] = 1 if collision else 0
+
+    def _op_skp(self, opcode: int) -> None:
+        handler = self._dispatch_E.get(opcode & 0xFF)
+        if handler is not None:
+            handler(opcode)
+        elif self.debug:
+            print(f"Unknown Ex?? opcode: {opcode:04X}")
+
+    def _op_skp_pressed(self, opcode: int) -> None:
+        if self.input_handler.is_key_pressed(self.V[(opcode >> 8) & 0xF]):
+            self.pc += 2
+
+    def _op_skp_not_pressed(self, opcode: int) -> None:
+        if not self.input_handler.is_key_pressed(self.V[(opcode >> 8) & 0xF]):
+            self.pc += 2
+
+    def _op_misc(self, opcode: int) -> None:
+        handler = self._dispatch_F.get(opcode & 0xFF)
+        if handler is not None:
+            handler(opcode)
+        elif self.debug:
+            print(f"Unknown Fx?? opcode: {opcode:04X}")
+
+    def _op_f_ld_dt(self, opcode: int) -> None:
+        self.V[(opcode >> 8) & 0xF] = self.delay_timer
+
+    def _op_f_wait_key(self, opcode: int) -> None:
+        self.V[(opcode >> 8) & 0xF] = self.input_handler.wait_for_key()
+
+    def _op_f_set_dt(self, opcode: int) -> None:
+        self.delay_timer = self.V[(opcode >> 8) & 0xF]
+
+    def _op_f_set_st(self, opcode: int) -> None:
+        self.sound.set_timer(self.V[(opcode >> 8) & 0xF])
+
+    def _op_f_add_i(self, opcode: int) -> None:
+        self.I += self.V[(opcode >> 8) & 0xF]
+
+    def _op_f_font(self, opcode: int) -> None:
+        self.I = self.V[(opcode >> 8) & 0xF] * 5
+
+    def _op_f_bcd(self, opcode: int) -> None:
+        memory, I = self.memory, self.I
+        hundreds, tens, ones = _BCD[self.V[(opcode >> 8) & 0xF]]
+        self._invalidate(I, I + 3)
+        memory[I] = hundreds
+        memory[I + 1] = tens
+        memory[I + 2] = ones
+
+    def _op_f_store(self, opcode: int, _MEM: int = MEMORY_SIZE) -> None:
+        I = self.I
+        count = ((opcode >> 8) & 0xF) + 1
+        # Slice copies are a single memcpy, but an array slice assignment running
+        # past the end would resize the array - reject that up front instead
+        if I + count > _MEM:
+            self.halted = True
+            raise RuntimeError("Register store out of memory bounds")
+        self.memory[I:I + count] = self.V[:count]
+        self._invalidate(I, I + count)
+        if self.config.quirks.load_store_increment_i:
+            self.I += count
+
+    def _op_f_load(self, opcode: int, _MEM: int = MEMORY_SIZE) -> None:
+        I = self.I
+        count = ((opcode >> 8) & 0xF) + 1
+        if I + count > _MEM:
+            self.halted = True
+            raise RuntimeError("Register load out of memory bounds")
+        self.V[:count] = self.memory[I:I + count]
+        if self.config.quirks.load_store_increment_i:
+            self.I += count
 
     def update_timers(self) -> None:
         if self.delay_timer > 0:
@@ -275,6 +493,73 @@ class Chip8:
         opcode = self.fetch_opcode()
         self.decode_and_execute(opcode)
 
+    def _run_cycles(self, cycles: int, _MEM: int = MEMORY_SIZE) -> None:
+        """Run `cycles` instructions with hot state bound to locals.
+
+        Same semantics as calling step() repeatedly, minus the per-instruction
+        attribute lookups, decoding (see `_predecode`) and input polling.
+        Handlers still read / write `self.pc`, so it is re-read every
+        iteration; any fault raises out of the loop with `halted` already set.
+        """
+        decoded = self._decoded
+        predecode = self._predecode
+        for _ in range(cycles):
+            pc = self.pc
+            if pc + 1 >= _MEM:
+                self.halted = True
+                raise RuntimeError(f"PC out of bounds: {pc:04X}")
+            entry = decoded[pc]
+            if entry is None:
+                entry = predecode(pc)
+            self.pc = pc + 2
+            handler, opcode = entry
+            handler(opcode)
+
+    def _run_cycles_debug(self, cycles: int) -> None:
+        """`_run_cycles` variant that traces every instruction."""
+        for _ in range(cycles):
+            self.decode_and_execute(self.fetch_opcode())
+
+    def _jit_can_draw(self) -> bool:
+        display = self.display
+        return isinstance(getattr(display, 'pixels', None), np.ndarray) and hasattr(display, 'mark_dirty')
+
+    def _run_cycles_jit(self, cycles: int) -> None:
+        """Run `cycles` instructions through the numba core (see `_core.py`).
+
+        The compiled loop works on zero-copy NumPy views of memory / V / stack
+        and stops in front of opcodes it leaves to Python; each of those runs
+        through `_run_cycles(1)` before the compiled loop resumes.
+        """
+        memory = np.frombuffer(self.memory, dtype=np.uint8)
+        V = np.frombuffer(self.V, dtype=np.uint8)
+        stack = np.frombuffer(self.stack, dtype=np.uint16)
+        state = self._jit_state
+        quirks = self.config.quirks
+        display = self.display
+        pixels = display.pixels  # NumPy-backed; set_debug only binds this path then
+        while cycles > 0:
+            state[:] = (self.pc, self.sp, self.I, self.delay_timer, 0, -1, 0, 0, 0, self._rand_idx, -1, 0)
+            keys = np.array(self.input_handler.keys, dtype=np.uint8)
+            rand_pool = np.frombuffer(self._rand_pool, dtype=np.uint8)
+            done = _jit_run_cycles(
+                memory, V, stack, keys, pixels, rand_pool, state, cycles, True,
+                quirks.shift_legacy, quirks.load_store_increment_i, quirks.draw_wrap,
+            )
+            self.pc, self.sp, self.I, self.delay_timer = int(state[0]), int(state[1]), int(state[2]), int(state[3])
+            self._rand_idx = int(state[9])
+            if state[10] >= 0:
+                # Memory the core wrote (Fx33 / Fx55) may hold cached decodes
+                self._invalidate(int(state[10]), int(state[11]))
+            if state[4]:
+                display.draw_flag = True
+                if state[5] >= 0:
+                    display.mark_dirty(int(state[5]), int(state[6]), int(state[7]), int(state[8]))
+            cycles -= done
+            if cycles > 0:
+                self._run_cycles(1)
+                cycles -= 1
+
     def run_frame(self) -> None:
         """Execute one *video frame* worth of emulation work.
 
@@ -282,12 +567,23 @@ class Chip8:
         tick timers once (60 Hz) and present a frame. Event polling happens
         once per frame to keep input latency low without excessive overhead.
         """
+        self.run_frames(1)
+
+    def run_frames(self, n: int) -> None:
+        """Execute `n` video frames back to back (e.g. catching up a missed deadline).
+
+        Each frame still runs cycles_per_frame instructions and ticks the
+        timers once, but events / keys are polled once for the batch and only
+        the final frame is rendered - the others would be on screen for
+        microseconds anyway.
+        """
         if self.halted:
             # Still tick timers so sounds decay properly
-            self.update_timers()
+            for _ in range(n):
+                self.update_timers()
             self.display.render()
             return
-        # Process window events (once per frame) before executing instructions
+        # Process window events (once per batch) before executing instructions
         events = None
         if self.using_pygame and hasattr(self.display, 'poll_events'):
             try:
@@ -304,16 +600,16 @@ class Chip8:
                 if handler:
                     handler(ev)
 
-        for _ in range(self.cycles_per_frame):
-            if self.halted:
-                break
-            self.step()
-        # Timers at 60Hz
-        self.update_timers()
-        # Only render once per frame
+        # Terminal input is polled once per batch rather than per instruction
+        self.input_handler.update_keys()
+        run_cycles = self._run_cycles_impl
+        cycles = self.cycles_per_frame
+        for _ in range(n):
+            run_cycles(cycles)
+            # Timers at 60Hz
+            self.update_timers()
+        # Only render once per batch
         self.display.render()
-        # Poll window events if pygame backend
-    # (Event polling moved to top of frame)
 
     def save_state(self, filename: str) -> None:
         """Persist a raw snapshot of core state to a binary file.
@@ -334,6 +630,7 @@ class Chip8:
     def load_state(self, filename: str) -> None:
         with open(filename, 'rb') as f:
             self.memory = array.array('B', f.read(MEMORY_SIZE))
+            self._decoded[:] = [None] * MEMORY_SIZE
             self.V = array.array('B', f.read(V_COUNT))
             self.stack = array.array('H', f.read(STACK_SIZE * 2))
             self.pc = int.from_bytes(f.read(2), 'big')
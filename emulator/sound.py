@@ -6,12 +6,17 @@ ASCII bell (\a) on transition from silent -> playing. Many terminals
 ignore or throttle the bell; for richer audio a future optional module
 could be plugged in. This keeps implementation dependency-free.
 """
+import sys
+
 
 class Sound:
     def __init__(self, enabled: bool = True):
         self.timer = 0
         self.playing = False
         self.enabled = enabled
+        # Bell bypasses print() like the console frames; None when stdout has no
+        # byte buffer (pythonw, IDLE, redirect_stdout to a StringIO)
+        self._stdout = getattr(sys.stdout, 'buffer', None)
 
     def set_timer(self, value: int):
         self.timer = int(value) & 0xFF
@@ -20,15 +25,18 @@ class Sound:
             self.playing = False
 
     def update(self):
-        if self.timer > 0:
-            # Emit bell only once per active period start
-            if not self.playing and self.enabled:
-                print('\a', end='')  # Terminal bell
-            self.playing = True
-            self.timer -= 1
-            if self.timer == 0:
-                self.playing = False
-        else:
+        if self.timer == 0:
+            return  # Silent; `playing` is always False while the timer is 0
+        # Emit bell only once per active period start
+        if not self.playing and self.enabled:
+            if self._stdout is not None:
+                self._stdout.write(b'\a')  # Terminal bell
+                self._stdout.flush()  # Rare (once per beep); pygame frames never flush stdout
+            else:
+                print('\a', end='', flush=True)  # No-op if sys.stdout is None
+        self.playing = True
+        self.timer -= 1
+        if self.timer == 0:
             self.playing = False
 
     def stop(self):
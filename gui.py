@@ -1,13 +1,28 @@
 # Alternative system as GUI to spawn Pygame as subprocess (direct launch did not work on MacOS)
 import sys
 import os
+import json
 import signal
+import functools
+from concurrent.futures import Future, ThreadPoolExecutor
+import socket
 import subprocess
+import threading
+import time
 import tkinter as tk
-from tkinter import filedialog, messagebox
-from typing import Optional
+from tkinter import filedialog, ttk
+from tkinter import font as tkfont
+from typing import Callable, Optional
+
+_PY = sys.executable
+_MAIN_PY = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'main.py')
 
 DEFAULT_SPEED = 12
+STOP_TIMEOUT_MS = 2000  # SIGTERM grace period before a stopped emulator is killed
+LOG_BYTES = 16 * 1024  # Child output kept for error reports
+TOAST_MS = 3000  # How long a notification stays up
+LAUNCH_POLL_MS = 10  # How often a pending background launch is checked
+POLL_MIN_MS, POLL_MAX_MS = 50, 2000  # Fallback child poll: fast after user actions, backing off
 SPEED_PRESETS = [
     ("Very Slow: 8", 8),
     ("Slow: 10", 10),
@@ -18,39 +33,272 @@ SPEED_PRESETS = [
 ]
 
 
+class _Pid:
+    """The slice of the Popen interface the controller uses, over a bare posix_spawn pid."""
+
+    def __init__(self, pid: int, args: list):
+        self.pid = pid
+        self.args = args
+        self.stdin = None
+        self.stdout = None
+        self.returncode: Optional[int] = None
+
+    def poll(self) -> Optional[int]:
+        if self.returncode is None:
+            try:
+                pid, status = os.waitpid(self.pid, os.WNOHANG)
+            except ChildProcessError:
+                self.returncode = 0  # Reaped elsewhere; status unknown (as Popen does)
+            else:
+                if pid:
+                    self.returncode = os.waitstatus_to_exitcode(status)
+        return self.returncode
+
+    def wait(self, timeout: Optional[float] = None) -> int:
+        if timeout is None:
+            if self.returncode is None:
+                try:
+                    self.returncode = os.waitstatus_to_exitcode(os.waitpid(self.pid, 0)[1])
+                except ChildProcessError:
+                    self.returncode = 0
+            return self.returncode
+        deadline = time.monotonic() + timeout
+        while self.poll() is None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise subprocess.TimeoutExpired(self.args, timeout)
+            time.sleep(min(remaining, 0.005))
+        return self.returncode
+
+    def send_signal(self, sig: int):
+        if self.poll() is None:
+            try:
+                os.kill(self.pid, sig)
+            except ProcessLookupError:
+                pass
+
+    def terminate(self):
+        self.send_signal(signal.SIGTERM)
+
+    def kill(self):
+        self.send_signal(signal.SIGKILL)
+
+
+def _posix_spawn(args: list, pipe_stdin: bool, pipe_output: bool) -> Optional[_Pid]:
+    """Start `args` in a new session with os.posix_spawn; None where that isn't supported."""
+    if not hasattr(os, 'posix_spawn'):
+        return None
+    # Pipe fds are non-inheritable; dup2 onto fd 0 / 1 / 2 makes the child's copies survive exec
+    file_actions = []
+    child_ends, parent_ends = [], []
+    if pipe_stdin:
+        r, w = os.pipe()
+        file_actions.append((os.POSIX_SPAWN_DUP2, r, 0))
+        child_ends.append(r)
+        parent_ends.append(w)
+    if pipe_output:
+        r, w = os.pipe()
+        file_actions += [(os.POSIX_SPAWN_DUP2, w, 1), (os.POSIX_SPAWN_DUP2, w, 2)]
+        child_ends.append(w)
+        parent_ends.append(r)
+    try:
+        pid = os.posix_spawn(args[0], args, os.environ, file_actions=file_actions, setsid=True)
+    except BaseException as e:
+        for fd in child_ends + parent_ends:
+            os.close(fd)
+        if isinstance(e, NotImplementedError):  # No POSIX_SPAWN_SETSID in this libc
+            return None
+        raise
+    for fd in child_ends:
+        os.close(fd)
+    proc = _Pid(pid, args)
+    if pipe_stdin:
+        proc.stdin = os.fdopen(parent_ends.pop(0), 'wb')
+    if pipe_output:
+        proc.stdout = os.fdopen(parent_ends.pop(0), 'rb', buffering=0)
+    return proc
+
+
+def _dismiss_warm(proc) -> None:
+    """Tell an idle `--stdin-control` interpreter to quit, close its pipes and reap it."""
+    try:
+        if proc.poll() is None:
+            proc.stdin.write(b'{"cmd": "quit"}\n')
+    except OSError:
+        pass  # Already gone; EOF on stdin makes it quit anyway
+    try:
+        proc.stdin.close()
+    except OSError:
+        pass
+    if proc.stdout is not None:
+        proc.stdout.close()
+    try:
+        proc.wait(timeout=STOP_TIMEOUT_MS / 1000)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+
+
 class EmulatorProcessController:
-    def __init__(self):
+    def __init__(self, schedule: Optional[Callable[[int, Callable[[], None]], object]] = None,
+                 capture_output: bool = False):
+        # `schedule(ms, fn)` (e.g. Tk's `after`) lets stop() return at once and
+        # enforce the kill timeout later; without it stop() waits as before.
+        # `capture_output` gives children one stdout+stderr pipe (`proc.stdout`).
+        self._schedule = schedule
+        self._capture_output = capture_output
+        self._stopping: list[tuple[subprocess.Popen, float]] = []  # (proc, kill deadline)
         self.proc: Optional[subprocess.Popen] = None
+        self.started_at: float = 0.0  # perf_counter() when `proc` was adopted
         self.rom_path: Optional[str] = None
         self.speed: int = DEFAULT_SPEED
         self.paused: bool = False
+        self._warm: Optional[subprocess.Popen] = None  # Idle main.py --stdin-control, imports done
+        # prewarm() fills `_warm` from its own thread while spawn() may be taking
+        # it on another; the lock covers `_warm`, `_prewarming` (one in flight at
+        # most) and `_closed` (set by shutdown(), after which nothing is kept)
+        self._warm_lock = threading.Lock()
+        self._prewarming = False
+        self._closed = False
+
+    def _spawn(self, args: list, pipe_stdin: bool = False):
+        # Own session so signals reach the whole child process group. posix_spawn
+        # first (Popen won't use it itself with start_new_session); it returns
+        # None where unavailable (Windows, libc without setsid support)
+        argv = [_PY, _MAIN_PY, *args]
+        proc = _posix_spawn(argv, pipe_stdin, self._capture_output)
+        if proc is not None:
+            return proc
+        # Python's fds are non-inheritable anyway, so skip the close_fds sweep
+        return subprocess.Popen(
+            argv,
+            close_fds=False,
+            start_new_session=True,
+            stdin=subprocess.PIPE if pipe_stdin else None,
+            stdout=subprocess.PIPE if self._capture_output else None,
+            stderr=subprocess.STDOUT if self._capture_output else None,
+            bufsize=0,
+        )
+
+    def prewarm(self):
+        """Start the next interpreter in the background so a launch skips its startup.
+
+        A no-op while one is starting or an idle one is still alive.
+        """
+        with self._warm_lock:
+            if self._prewarming or self._closed or (self._warm is not None and self._warm.poll() is None):
+                return
+            self._prewarming = True
+            dead, self._warm = self._warm, None
+        if dead is not None:
+            _dismiss_warm(dead)
+
+        def spawn():
+            try:
+                proc = self._spawn(['--stdin-control'], pipe_stdin=True)
+            except Exception:
+                proc = None  # start() falls back to a cold launch
+            with self._warm_lock:
+                self._prewarming = False
+                if not self._closed:
+                    self._warm, proc = proc, None
+            if proc is not None:
+                _dismiss_warm(proc)  # shutdown() ran while it was starting
+        threading.Thread(target=spawn, daemon=True).start()
+
+    def _take_warm(self, rom_path: str, speed: int) -> Optional[subprocess.Popen]:
+        with self._warm_lock:
+            warm, self._warm = self._warm, None
+        if warm is None:
+            return None
+        if warm.poll() is None:
+            try:
+                warm.stdin.write(json.dumps({"rom": rom_path, "speed": speed}).encode() + b"\n")
+                warm.stdin.close()
+            except OSError:
+                pass
+            else:
+                return warm
+        _dismiss_warm(warm)  # Died while idle: reap it and launch cold
+        return None
+
+    def spawn(self, rom_path: str, speed: int) -> subprocess.Popen:
+        """Launch an emulator without touching the current one; safe off the Tk thread."""
+        proc = self._take_warm(rom_path, speed)
+        if proc is None:
+            try:
+                proc = self._spawn([rom_path, str(speed)])
+            except FileNotFoundError:
+                raise
+            except Exception as e:
+                raise RuntimeError(f"Failed to launch emulator: {e}")
+        self.prewarm()
+        return proc
+
+    def adopt(self, proc: subprocess.Popen):
+        """Make a spawned emulator the current one, stopping any other."""
+        self.stop()
+        self.proc = proc
+        self.started_at = time.perf_counter()
+        self.paused = False
+
+    def running(self) -> bool:
+        return self.proc is not None and self.proc.poll() is None
 
     def start(self, rom_path: str, speed: int):
         self.stop()
         self.rom_path = rom_path
         self.speed = speed
-        py = sys.executable
-        main_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'main.py')
-        try:
-            self.proc = subprocess.Popen([py, main_path, rom_path, str(speed)])
-        except FileNotFoundError:
-            raise
-        except Exception as e:
-            raise RuntimeError(f"Failed to launch emulator: {e}")
-        self.paused = False
+        self.adopt(self.spawn(rom_path, speed))
 
     def stop(self):
-        if self.proc and self.proc.poll() is None:
+        proc, self.proc = self.proc, None
+        if proc and proc.poll() is None:
             try:
-                self.proc.terminate()
-                self.proc.wait(timeout=2)
+                proc.terminate()
+                if self.paused:
+                    os.killpg(proc.pid, signal.SIGCONT)  # A stopped process can't act on SIGTERM
+                if self._schedule is None:
+                    proc.wait(timeout=STOP_TIMEOUT_MS / 1000)
+                else:
+                    self._stopping.append((proc, time.monotonic() + STOP_TIMEOUT_MS / 1000))
+                    self._schedule(STOP_TIMEOUT_MS, self._kill_overdue)
             except subprocess.TimeoutExpired:
-                self.proc.kill()
+                proc.kill()
             except Exception:
                 pass
-        self.proc = None
         self.paused = False
 
+    def reap_stopped(self):
+        """Collect stopped emulators that have exited (call on child-exit notification)."""
+        self._stopping = [entry for entry in self._stopping if entry[0].poll() is None]
+
+    def _kill_overdue(self):
+        now = time.monotonic()
+        for proc, deadline in self._stopping:
+            if deadline <= now and proc.poll() is None:
+                try:
+                    proc.kill()
+                except Exception:
+                    pass
+        self.reap_stopped()
+
+    def shutdown(self):
+        """Stop the emulator and dismiss the idle warm interpreter."""
+        self.stop()
+        # No event loop left to enforce the timeout, so finish it here
+        for proc, deadline in self._stopping:
+            try:
+                proc.wait(timeout=max(0.0, deadline - time.monotonic()))
+            except subprocess.TimeoutExpired:
+                proc.kill()
+        self._stopping.clear()
+        with self._warm_lock:
+            self._closed = True
+            warm, self._warm = self._warm, None
+        if warm is not None:
+            _dismiss_warm(warm)
+
     def restart(self):
         if self.rom_path:
             self.start(self.rom_path, self.speed)
@@ -59,13 +307,17 @@ class EmulatorProcessController:
         if not self.proc or self.proc.poll() is not None:
             return
         if sys.platform != 'win32':  # Use POSIX signals
+            # The child leads its own session, so its pid is the process group id:
+            # signal the whole group so helper processes stop / resume with it
             try:
                 if not self.paused:
-                    os.kill(self.proc.pid, signal.SIGSTOP)
+                    os.killpg(self.proc.pid, signal.SIGSTOP)
                     self.paused = True
                 else:
-                    os.kill(self.proc.pid, signal.SIGCONT)
+                    os.killpg(self.proc.pid, signal.SIGCONT)
                     self.paused = False
+            except ProcessLookupError:
+                pass  # Exited between poll() and the signal
             except Exception:
                 pass
 
@@ -74,27 +326,71 @@ class TkMainLauncher:
     def __init__(self, initial_rom: Optional[str]):
         self.root = tk.Tk()
         self.root.title("CHIP-8 Emulator Launcher")
-        self.root.geometry("480x190")
-        self.ctrl = EmulatorProcessController()
+        self.root.geometry("480x220")
+        # Child output is drained through Tk file handlers, which Windows lacks
+        capture = sys.platform != 'win32' and hasattr(self.root.tk, 'createfilehandler')
+        self.ctrl = EmulatorProcessController(schedule=self.root.after, capture_output=capture)
+        self._log = bytearray()  # Tail of the current emulator's stdout / stderr
+        # Captured output is still shown in our terminal, when there is one
+        # (None under pythonw or a stdout without a byte buffer)
+        self._echo = getattr(sys.stdout, 'buffer', None) if capture else None
+        self._spawn_pool = ThreadPoolExecutor(max_workers=1)  # fork/exec off the Tk thread
+        self._pending: list[Future] = []  # Launches not yet picked up by `_on_launched`
 
         self.status_var = tk.StringVar(value="No ROM loaded")
+        # The status line is composed from these; status_var is only written when it changes
+        self._base_status = "No ROM loaded"
+        self._exit_suffix = ""
+        self._last_status = self._base_status
         self.speed_var = tk.StringVar(value=f"Speed: {DEFAULT_SPEED}")
 
         self._build_ui()
         self._build_menu()
-        self._monitor_proc()  # start monitoring
+        self._poll_ms = POLL_MIN_MS
+        self._poll_job: Optional[str] = None
+        self._uptime_job: Optional[str] = None
+        self._toast_win: Optional[tk.Toplevel] = None
+        self._toast_job: Optional[str] = None  # Its auto-dismiss timer
+        self._install_child_watch()
+        self.ctrl.prewarm()
 
         if initial_rom:
-            self.root.after(100, lambda: self._launch_rom(initial_rom))
+            self.root.after(100, self._launch_rom, initial_rom)
 
     # --- UI ---
     def _build_ui(self):
-        tk.Label(self.root, text="CHIP-8 Emulator", font=("Arial", 16, "bold")).pack(pady=4)
-        tk.Label(self.root, textvariable=self.status_var, font=("Arial", 12), fg="blue").pack()
-        tk.Label(self.root, textvariable=self.speed_var, font=("Arial", 10), fg="gray40").pack(pady=2)
-        tk.Label(self.root, text="Open a ROM via File → Open ROM...", font=("Arial", 9), fg="gray55").pack(pady=4)
-        tk.Label(self.root, text="Keypad 123C/456D/789E/A0BF → 1234/QWER/ASDF/ZXCV", font=("Arial", 9)).pack(pady=2)
-        tk.Label(self.root, text="A separate terminal/pygame window will appear.", font=("Arial", 8), fg="gray55").pack(side=tk.BOTTOM, pady=4)
+        # One named Tk font per size / weight, shared by every style using it
+        # (kept on self: a Font is deleted from Tk when garbage collected)
+        self.f_title = tkfont.Font(family="Arial", size=16, weight="bold")
+        self.f_status = tkfont.Font(family="Arial", size=12)
+        self.f_body = tkfont.Font(family="Arial", size=10)
+        self.f_hint = tkfont.Font(family="Arial", size=9)
+
+        # Fonts / colours live on named styles, configured once
+        style = ttk.Style(self.root)
+        style.configure("Title.TLabel", font=self.f_title)
+        style.configure("Status.TLabel", font=self.f_status, foreground="blue")
+        style.configure("Speed.TLabel", font=self.f_body, foreground="gray40")
+        style.configure("Hint.TLabel", font=self.f_hint, foreground="gray55")
+        style.configure("Info.TLabel", font=self.f_body, padding=8)
+        style.configure("Error.TLabel", font=self.f_body, foreground="red3", padding=8)
+
+        ttk.Label(self.root, text="CHIP-8 Emulator", style="Title.TLabel").pack(pady=4)
+        ttk.Label(self.root, textvariable=self.status_var, style="Status.TLabel").pack()
+        ttk.Label(self.root, textvariable=self.speed_var, style="Speed.TLabel").pack(pady=2)
+        self.speed_choice = tk.IntVar(value=DEFAULT_SPEED)
+        ttk.OptionMenu(
+            self.root, self.speed_choice, DEFAULT_SPEED, *[val for _, val in SPEED_PRESETS],
+            command=self._set_speed,
+        ).pack()
+        ttk.Label(
+            self.root,
+            text="Open a ROM via File → Open ROM...\n"
+                 "Keypad 123C/456D/789E/A0BF → 1234/QWER/ASDF/ZXCV\n"
+                 "A separate terminal/pygame window will appear.",
+            style="Hint.TLabel",
+            justify=tk.CENTER,
+        ).pack(pady=4)
 
     def _build_menu(self):
         menubar = tk.Menu(self.root)
@@ -111,13 +407,8 @@ class TkMainLauncher:
         emu_menu.add_command(label="Stop", command=self._stop)
         menubar.add_cascade(label="Emulation", menu=emu_menu)
 
-        speed_menu = tk.Menu(menubar, tearoff=0)
-        for label, val in SPEED_PRESETS:
-            speed_menu.add_command(label=label, command=lambda v=val: self._set_speed(v))
-        menubar.add_cascade(label="Speed", menu=speed_menu)
-
         help_menu = tk.Menu(menubar, tearoff=0)
-        help_menu.add_command(label="About", command=lambda: messagebox.showinfo("About", "CHIP-8 Emulator Launcher\nSpawns main.py"))
+        help_menu.add_command(label="About", command=functools.partial(self._toast, "CHIP-8 Emulator Launcher\nSpawns main.py"))
         menubar.add_cascade(label="Help", menu=help_menu)
 
         self.root.config(menu=menubar)
@@ -129,43 +420,227 @@ class TkMainLauncher:
             self._launch_rom(path)
 
     def _launch_rom(self, path: str):
-        try:
-            self.ctrl.start(path, self.ctrl.speed)
-            self.status_var.set(f"ROM: {os.path.basename(path)}")
-        except Exception as e:
-            messagebox.showerror("Launch Failed", str(e))
+        # Stop the old emulator now; the new one is spawned on the worker thread
+        # and picked up here by `_on_launched`
+        self.ctrl.stop()
+        self.ctrl.rom_path = path
+        future = self._spawn_pool.submit(self.ctrl.spawn, path, self.ctrl.speed)
+        self._pending.append(future)
+        self.root.after(LAUNCH_POLL_MS, self._on_launched, future, path)
+
+    def _on_launched(self, future: Future, path: str):
+        # Checked from the Tk thread: the worker never calls into Tk, which could
+        # deadlock it against a launcher that is shutting down
+        if not future.done():
+            self.root.after(LAUNCH_POLL_MS, self._on_launched, future, path)
+            return
+        self._pending.remove(future)
+        exc = future.exception()
+        if exc is not None:
+            self._toast(f"Launch failed: {exc}", "error")
+            return
+        proc = future.result()
+        self.ctrl.adopt(proc)
+        self._log.clear()
+        self._attach_output(proc)
+        self._watch_child()
+        self._kick_poll()
+        self._set_status(f"ROM: {os.path.basename(path)}")
+        self._reap()  # In case it exited before being adopted
+        self._tick_uptime()
 
     def _restart(self):
-        self.ctrl.restart()
+        if self.ctrl.rom_path:
+            self._launch_rom(self.ctrl.rom_path)
 
     def _pause_resume(self):
         self.ctrl.toggle_pause()
-        suffix = " (Paused)" if self.ctrl.paused else ""
-        base = self.status_var.get().split(" (Paused)")[0]
-        self.status_var.set(base + suffix)
+        self._kick_poll()
+        self._update_status()
 
     def _stop(self):
         self.ctrl.stop()
-        self.status_var.set("Stopped (ROM loaded)" if self.ctrl.rom_path else "No ROM loaded")
-
-    def _set_speed(self, speed: int):
+        self._set_status("Stopped (ROM loaded)" if self.ctrl.rom_path else "No ROM loaded")
+        self._tick_uptime()
+
+    def _toast(self, text: str, kind: str = "info"):
+        """Show a transient, non-modal notice over the launcher (click to dismiss).
+
+        Unlike messagebox it doesn't run a nested event loop, so launches and
+        exit notifications keep being processed while it is up.
+        """
+        if self._toast_job is not None:
+            self.root.after_cancel(self._toast_job)
+            self._toast_job = None
+        if self._toast_win is not None:
+            self._toast_win.destroy()
+        top = self._toast_win = tk.Toplevel(self.root)
+        top.overrideredirect(True)
+        label = ttk.Label(top, text=text, style="Error.TLabel" if kind == "error" else "Info.TLabel",
+                          wraplength=420, justify=tk.CENTER)
+        label.pack()
+        top.update_idletasks()
+        x = self.root.winfo_rootx() + (self.root.winfo_width() - top.winfo_reqwidth()) // 2
+        y = self.root.winfo_rooty() + self.root.winfo_height() - top.winfo_reqheight() - 8
+        top.geometry(f"+{x}+{y}")
+
+        def dismiss(*_):
+            if self._toast_win is top:
+                self._toast_win = None
+                if self._toast_job is not None:
+                    self.root.after_cancel(self._toast_job)
+                    self._toast_job = None
+            top.destroy()
+        label.bind("<Button-1>", dismiss)
+        # On root, not `top`: a timer left on a destroyed Toplevel would still fire
+        self._toast_job = self.root.after(TOAST_MS, dismiss)
+
+    def _update_speed_label(self):
+        label = f"Speed: {self.ctrl.speed}"
+        if self.ctrl.running():
+            label += f"  Up: {time.perf_counter() - self.ctrl.started_at:.0f}s"
+        if label != self.speed_var.get():
+            self.speed_var.set(label)
+
+    def _tick_uptime(self):
+        # Once a second while an emulator runs; goes quiet when it exits or stops
+        if self._uptime_job is not None:
+            self.root.after_cancel(self._uptime_job)
+            self._uptime_job = None
+        self._update_speed_label()
+        if self.ctrl.running():
+            self._uptime_job = self.root.after(1000, self._tick_uptime)
+
+    def _set_status(self, base: str):
+        self._base_status = base
+        self._exit_suffix = ""
+        self._update_status()
+
+    def _update_status(self):
+        paused = " (Paused)" if self.ctrl.paused else ""
+        new = f"{self._base_status}{paused}{self._exit_suffix}"
+        if new != self._last_status:
+            self.status_var.set(new)
+            self._last_status = new
+
+    def _set_speed(self, speed):
+        speed = int(speed)
         self.ctrl.speed = speed
-        self.speed_var.set(f"Speed: {speed}")
+        self._update_speed_label()
         # If running, restart with new speed
-        if self.ctrl.proc and self.ctrl.proc.poll() is None:
-            self.ctrl.restart()
+        if self.ctrl.running():
+            self._restart()
 
     def _quit(self):
-        self.ctrl.stop()
+        # Let an in-flight launch finish and hand it over, so shutdown() stops it too
+        self._spawn_pool.shutdown(wait=True, cancel_futures=True)
+        for future in self._pending:
+            if not future.cancelled() and future.exception() is None:
+                self.ctrl.adopt(future.result())
+        self.ctrl.shutdown()
         self.root.destroy()
 
-    def _monitor_proc(self):
-        if self.ctrl.proc and self.ctrl.proc.poll() is not None:
-            code = self.ctrl.proc.returncode
-            current = self.status_var.get().split(' (Exited')[0]
-            self.status_var.set(f"{current} (Exited {code})")
+    # --- Child exit notification ---
+    def _install_child_watch(self):
+        """Get told when the emulator exits instead of polling it.
+
+        POSIX: SIGCHLD. Python runs signal handlers only between bytecodes, and
+        Tk's mainloop can sit in C indefinitely, so the signal wakeup fd is a
+        socket registered with Tk; its readiness wakes the loop, the handler
+        runs and queues `_reap`. Windows: see `_watch_child`. If neither is
+        available, fall back to `_poll_child`.
+        """
+        if sys.platform == 'win32':
+            self.root.bind_all("<<ChildExited>>", self._reap)
+            return
+        try:
+            createfilehandler = self.root.tk.createfilehandler
+            self._wake_r, self._wake_w = socket.socketpair()
+            self._wake_r.setblocking(False)
+            self._wake_w.setblocking(False)
+            signal.set_wakeup_fd(self._wake_w.fileno())
+            signal.signal(signal.SIGCHLD, lambda *_: self.root.after_idle(self._reap))
+            createfilehandler(self._wake_r.fileno(), tk.READABLE, self._drain_wakeup)
+        except (AttributeError, ValueError, OSError):
+            self._poll_child()
+
+    def _poll_child(self):
+        self._reap()
+        self._poll_ms = min(self._poll_ms * 2, POLL_MAX_MS)
+        self._poll_job = self.root.after(self._poll_ms, self._poll_child)
+
+    def _kick_poll(self):
+        # Poll again soon after a user action; it backs off again while nothing changes
+        self._poll_ms = POLL_MIN_MS
+        if self._poll_job is not None:
+            self.root.after_cancel(self._poll_job)
+            self._poll_job = self.root.after(POLL_MIN_MS, self._poll_child)
+
+    def _drain_wakeup(self, *_):
+        try:
+            while self._wake_r.recv(64):
+                pass
+        except BlockingIOError:
+            pass
+
+    def _watch_child(self):
+        # Windows has no SIGCHLD: a thread blocks on the child and posts a Tk event
+        proc = self.ctrl.proc
+        if sys.platform != 'win32' or proc is None:
+            return
+
+        def wait():
+            proc.wait()
+            try:
+                self.root.event_generate("<<ChildExited>>", when='tail')
+            except (tk.TclError, RuntimeError):
+                pass  # Launcher already closed
+
+        threading.Thread(target=wait, daemon=True).start()
+
+    def _reap(self, *_):
+        self.ctrl.reap_stopped()
+        proc = self.ctrl.proc
+        if proc and proc.poll() is not None:
+            code = proc.returncode
+            self._exit_suffix = f" (Exited {code})"
+            if proc.stdout is not None and not proc.stdout.closed:
+                self._drain_output(proc)  # Pick up what it wrote just before exiting
             self.ctrl.proc = None
-        self.root.after(1000, self._monitor_proc)
+            self._update_status()
+            self._tick_uptime()
+            if code and self._log:
+                tail = self._log.decode('utf-8', 'replace').strip().splitlines()[-3:]
+                self._toast("\n".join(tail), "error")
+
+    # --- Child output ---
+    def _attach_output(self, proc):
+        """Drain the child's output pipe whenever Tk sees it readable (no polling)."""
+        if proc.stdout is None:
+            return
+        fd = proc.stdout.fileno()
+        os.set_blocking(fd, False)
+        self.root.tk.createfilehandler(fd, tk.READABLE, lambda *_: self._drain_output(proc))
+
+    def _drain_output(self, proc):
+        # Read what's there; unregister and close at EOF. Output is echoed to our
+        # own stdout, and the current emulator's is kept in the `_log` ring
+        fd = proc.stdout.fileno()
+        while True:
+            try:
+                data = os.read(fd, 4096)
+            except BlockingIOError:
+                return
+            if not data:
+                self.root.tk.deletefilehandler(fd)
+                proc.stdout.close()
+                return
+            if self._echo is not None:
+                self._echo.write(data)
+                self._echo.flush()
+            if proc is self.ctrl.proc:
+                self._log += data
+                del self._log[:-LOG_BYTES]
 
     def run(self):
         self.root.protocol("WM_DELETE_WINDOW", self._quit)
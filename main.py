@@ -1,20 +1,144 @@
 # Entry point for running the CHIP-8 emulator directly.
+import json
+import os
 import sys
 import time
-from emulator.emulator import Chip8, DEFAULT_CYCLES_PER_FRAME
+from typing import TYPE_CHECKING, Optional
 from emulator.constants import TIMER_FREQ
 
+if TYPE_CHECKING:
+    from emulator.emulator import Chip8
+
+FRAME_NS = 1_000_000_000 // TIMER_FREQ  # 60Hz, integer nanoseconds
+MAX_CATCHUP = 4  # Most frames run back-to-back after a missed deadline
+
+
+def _timerfd_waiter(frame_ns: int):
+    """Linux (Python 3.13+): a periodic CLOCK_MONOTONIC timerfd.
+
+    Each read blocks until the next period and returns how many periods
+    elapsed since the last read, so the kernel keeps the schedule.
+    """
+    tfd = os.timerfd_create(time.CLOCK_MONOTONIC)
+    os.timerfd_settime_ns(tfd, initial=frame_ns, interval=frame_ns)
+
+    def wait() -> int:
+        return int.from_bytes(os.read(tfd, 8), sys.byteorder)
+    return wait
+
+
+def _win_timer_sleep():
+    """Windows: a high-resolution waitable timer, or None if unsupported (pre-1803)."""
+    import ctypes
+    from ctypes import wintypes
+    kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    kernel32.CreateWaitableTimerExW.restype = wintypes.HANDLE
+    kernel32.CreateWaitableTimerExW.argtypes = (ctypes.c_void_p, wintypes.LPCWSTR, wintypes.DWORD, wintypes.DWORD)
+    kernel32.SetWaitableTimer.argtypes = (
+        wintypes.HANDLE, ctypes.POINTER(wintypes.LARGE_INTEGER), wintypes.LONG,
+        ctypes.c_void_p, ctypes.c_void_p, wintypes.BOOL,
+    )
+    CREATE_WAITABLE_TIMER_HIGH_RESOLUTION = 0x00000002
+    TIMER_ALL_ACCESS = 0x1F0003
+    INFINITE = 0xFFFFFFFF
+    handle = kernel32.CreateWaitableTimerExW(None, None, CREATE_WAITABLE_TIMER_HIGH_RESOLUTION, TIMER_ALL_ACCESS)
+    if not handle:
+        return None
+
+    def sleep(seconds: float) -> None:
+        due = wintypes.LARGE_INTEGER(-int(seconds * 10_000_000))  # Relative, 100 ns units
+        kernel32.SetWaitableTimer(handle, ctypes.byref(due), 0, None, None, False)
+        kernel32.WaitForSingleObject(handle, INFINITE)
+    return sleep
+
+
+SPIN_MARGIN_NS = 500_000  # Sleep until this close to the deadline, then spin
+
+
+def _deadline_waiter(frame_ns: int, sleep):
+    """Track the schedule in integer perf_counter_ns and block with `sleep` until the next frame.
+
+    `sleep` can overshoot by tens of microseconds (or a whole scheduler
+    tick), so it stops SPIN_MARGIN_NS short and the rest is a busy-wait.
+    """
+    clock = time.perf_counter_ns
+    next_frame = clock()
+
+    def wait() -> int:
+        nonlocal next_frame
+        remaining = next_frame - clock()
+        if remaining > SPIN_MARGIN_NS:
+            sleep((remaining - SPIN_MARGIN_NS) / 1e9)
+        while clock() < next_frame:
+            pass
+        # Step past every deadline already reached in one go; exact in ints, so no drift
+        due = (clock() - next_frame) // frame_ns + 1
+        next_frame += due * frame_ns
+        return due
+    return wait
+
+
+def frame_waiter(frame_ns: int):
+    """Return a `wait()` that blocks until a frame is due and returns how many are."""
+    if hasattr(os, 'timerfd_create'):
+        return _timerfd_waiter(frame_ns)
+    if sys.platform == 'win32':
+        sleep = _win_timer_sleep()
+        if sleep is not None:
+            return _deadline_waiter(frame_ns, sleep)
+    return _deadline_waiter(frame_ns, time.sleep)
+
+
+def tick(emulator: "Chip8", wait) -> None:
+    """Wait for the next frame, then run every frame that came due, up to MAX_CATCHUP.
+
+    Short hiccups are made up so game speed stays steady; beyond the cap
+    the backlog is dropped, so a long stall (or a slow run_frame) can't
+    snowball into an ever-growing catch-up burst.
+    """
+    emulator.run_frames(min(wait(), MAX_CATCHUP))
+
+
+def _read_control():
+    """`--stdin-control`: wait, with everything imported, for a launch request.
+
+    The launcher keeps one such process warm and writes a single JSON line:
+    {"rom": path, "speed": cycles_per_frame} to start, {"cmd": "quit"} (or EOF)
+    to exit. Returns (rom_file, cycles or None for the default) or None.
+    """
+    line = sys.stdin.readline()
+    if not line:
+        return None
+    msg = json.loads(line)
+    if msg.get("cmd") == "quit":
+        return None
+    speed = msg.get("speed")
+    return msg["rom"], None if speed is None else int(speed)
+
+
 def main() -> int:
     if len(sys.argv) < 2:
         print("Usage: python main.py <rom_file> [cycles_per_frame]")
         return 1
-    rom_file = sys.argv[1]
-    try:
-        cycles = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_CYCLES_PER_FRAME
-    except ValueError:
-        print("cycles_per_frame must be an integer")
-        return 1
+    cycles: Optional[int]
+    if sys.argv[1] == "--stdin-control":
+        from emulator import emulator as _preload  # noqa: F401  Pay for the imports before a ROM is requested
+        request = _read_control()
+        if request is None:
+            return 0
+        rom_file, cycles = request
+    else:
+        rom_file = sys.argv[1]
+        try:
+            cycles = int(sys.argv[2]) if len(sys.argv) > 2 else None
+        except ValueError:
+            print("cycles_per_frame must be an integer")
+            return 1
 
+    # Imported only now, so a bad command line fails before pygame & co. load
+    from emulator.emulator import Chip8, DEFAULT_CYCLES_PER_FRAME
+    if cycles is None:
+        cycles = DEFAULT_CYCLES_PER_FRAME
     emulator = Chip8(cycles_per_frame=cycles)
     try:
         emulator.load_rom(rom_file)
@@ -22,20 +146,10 @@ def main() -> int:
         print(f"ROM file {rom_file} not found.")
         return 1
 
-    frame_time = 1 / TIMER_FREQ  # 60Hz
-    next_frame = time.perf_counter()
+    wait = frame_waiter(FRAME_NS)
     try:
         while True:
-            now = time.perf_counter()
-            if now >= next_frame:
-                emulator.run_frame()
-                # Catch up if we're behind (avoid cumulative drift)
-                while next_frame <= now:
-                    next_frame += frame_time
-            # Sleep until next frame minus small safety margin
-            sleep_for = next_frame - time.perf_counter() - 0.0002
-            if sleep_for > 0:
-                time.sleep(sleep_for)
+            tick(emulator, wait)
     except KeyboardInterrupt:
         print("Emulation stopped.")
         emulator.sound.stop()